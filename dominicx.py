@@ -8,6 +8,7 @@ Features:
 - Auto-install missing Go-based tools via `go install` (requires `go` available)
 - Auto-clone dirsearch if missing
 - Attempt package manager install for nmap (apt or brew)
+- Passive subdomain sources (crt.sh, urlscan) fetched concurrently
 - Run real recon pipeline (subfinder -> httpx -> naabu -> nmap -> dirsearch -> katana -> nuclei)
 - Logs errors to outdir/logs/error.log
 
@@ -18,15 +19,26 @@ WARNING: This script executes network scans and runs external tools. Only use on
 """
 
 import argparse
+import codecs
+import json
 import shutil
 import subprocess
 import sys
 import os
 import time
 import datetime
+import functools
 import logging
+import mmap
+import multiprocessing
+import queue
+import threading
+import urllib.request
+from collections import defaultdict
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 # -------------------- Config --------------------
 GO_PACKAGES = {
@@ -39,6 +51,8 @@ GO_PACKAGES = {
 REQUIRED = ['subfinder', 'httpx', 'naabu', 'nmap', 'katana', 'dirsearch', 'nuclei']
 THREADS = 40
 TIMEOUT = 3600
+HTTP_TIMEOUT = 300
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) dominicx-recon'
 
 # -------------------- Logging --------------------
 logger = logging.getLogger('dominicx')
@@ -59,15 +73,21 @@ except Exception:
     Fore = _C()
     Style = _C()
 
+# Faster JSON decoding (optional, falls back to json.loads)
+try:
+    from orjson import loads as json_loads
+except Exception:
+    json_loads = json.loads
+
 # -------------------- Utils --------------------
 
 def now_ts():
-    return datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
 
 
-def run(cmd: List[str], cwd: Path = None, timeout: int = TIMEOUT) -> subprocess.CompletedProcess:
+def run(cmd: List[str], cwd: Path = None, timeout: int = TIMEOUT, env: dict = None) -> subprocess.CompletedProcess:
     try:
-        cp = subprocess.run(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=timeout)
+        cp = subprocess.run(cmd, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=timeout)
         return cp
     except subprocess.TimeoutExpired:
         return subprocess.CompletedProcess(cmd, 124, stdout='', stderr=f'Timeout after {timeout}s')
@@ -75,14 +95,116 @@ def run(cmd: List[str], cwd: Path = None, timeout: int = TIMEOUT) -> subprocess.
         return subprocess.CompletedProcess(cmd, 1, stdout='', stderr=str(e))
 
 
+def popen(cmd: List[str], **kwargs) -> Optional[subprocess.Popen]:
+    try:
+        return subprocess.Popen(cmd, **kwargs)
+    except Exception as e:
+        logger.error('Failed to start %s: %s', cmd[0], e)
+        return None
+
+
+def wait_proc(p: subprocess.Popen, timeout: int = TIMEOUT) -> int:
+    try:
+        return p.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        p.kill()
+        p.wait()
+        return 124
+
+
+@functools.lru_cache(maxsize=None)
 def which(bin_name: str) -> bool:
     return shutil.which(bin_name) is not None
 
 
-def write_file(p: Path, data: str):
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with open(p, 'a') as f:
-        f.write(data)
+def http_get(url: str, timeout: int = HTTP_TIMEOUT):
+    req = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+    return urllib.request.urlopen(req, timeout=timeout)
+
+
+def iter_json_array(fp, chunk_size: int = 1 << 16):
+    """Yield the objects of a top-level JSON array read from a binary stream, chunk by chunk"""
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    buf, pos, started = '', 0, False
+    while True:
+        chunk = fp.read(chunk_size)
+        buf = buf[pos:] + utf8.decode(chunk, final=not chunk)
+        pos = 0
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buf):
+                break
+            if not started:
+                if buf[pos] != '[':
+                    raise ValueError('expected a JSON array')
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == ']':
+                return
+            try:
+                item, pos = decoder.raw_decode(buf, pos)
+            except ValueError:
+                if not chunk:
+                    raise
+                # element continues in the next chunk
+                break
+            yield item
+        if not chunk:
+            return
+
+
+def _count_lines(p: Path) -> int:
+    """Count lines by scanning a memory map for newlines (no per-line Python work)"""
+    with open(p, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # mmap.count() only exists on 3.13+; bytes.count on slices is the same memchr scan
+            n = sum(mm[i:i + (1 << 24)].count(b'\n') for i in range(0, size, 1 << 24))
+            # count a trailing line without a newline, like iterating the file would
+            if mm[size - 1:size] != b'\n':
+                n += 1
+    return n
+
+
+def append_file(outf, src: Path):
+    """Append src to the binary file object outf, in-kernel via sendfile where supported"""
+    with open(src, 'rb') as rf:
+        size = os.fstat(rf.fileno()).st_size
+        outf.flush()
+        try:
+            off = 0
+            while off < size:
+                sent = os.sendfile(outf.fileno(), rf.fileno(), off, size - off)
+                if sent == 0:
+                    break
+                off += sent
+        except (AttributeError, OSError):
+            # no sendfile to regular files (e.g. macOS); copy through userspace
+            rf.seek(off)
+            shutil.copyfileobj(rf, outf)
+
+
+def _safe_name(url: str) -> str:
+    return url.replace('://', '_').replace('/', '_').replace(':', '_')
+
+
+def _run_dirsearch(url: str, dir_out: Path, dirsearch_cmd: List[str]) -> subprocess.CompletedProcess:
+    cmd = dirsearch_cmd + ['-u', url, '-x', '403,404,500,400,502,503,429', '--random-agent', '-e', 'php,js,html', '-o', str(dir_out / f'{_safe_name(url)}.txt')]
+    return run(cmd)
+
+
+def _run_katana(url: str, kat_out: Path) -> subprocess.CompletedProcess:
+    return run(['katana', '-u', url, '-o', str(kat_out / f'{_safe_name(url)}.txt')])
+
+
+def _run_nuclei(hosts: Path, out: Path) -> subprocess.CompletedProcess:
+    return run(['nuclei', '-l', str(hosts), '-rl', '10', '-bs', '2', '-c', '4', '-as', '-severity', 'critical,high,medium', '-o', str(out)])
+
 
 # -------------------- Banner --------------------
 DOMINICX_BANNER = r'''
@@ -151,7 +273,7 @@ def clone_dirsearch(outdir: Path) -> bool:
 # -------------------- Recon Class --------------------
 class ReconAuto:
     def __init__(self, target: str, outdir: Path, do_install: bool = False):
-        self.target = target
+        self.target = target.lower().rstrip('.')
         self.outdir = outdir
         self.do_install = do_install
         self.logdir = outdir / 'logs'
@@ -160,7 +282,32 @@ class ReconAuto:
         fh = logging.FileHandler(str(self.error_log), encoding='utf-8')
         fh.setLevel(logging.DEBUG)
         fh.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
-        logger.addHandler(fh)
+        # records are formatted and written by the listener thread, off the callers' path
+        log_queue = queue.Queue(-1)
+        self._log_handler = QueueHandler(log_queue)
+        logger.addHandler(self._log_handler)
+        self._log_listener = QueueListener(log_queue, fh)
+        self._log_listener.start()
+        self._pool = None
+        self._naabu = None
+
+    def executor(self) -> ProcessPoolExecutor:
+        """Worker pool shared by all per-host tool runs; created on first use"""
+        if self._pool is None:
+            # spawn, not fork: the pool is created from worker threads, and a forked child can
+            # inherit a lock another thread was holding and hang forever
+            self._pool = ProcessPoolExecutor(max_workers=max(1, THREADS // 4), mp_context=multiprocessing.get_context('spawn'))
+        return self._pool
+
+    def close_log(self):
+        """Detach the queue handler and flush pending records to error.log"""
+        logger.removeHandler(self._log_handler)
+        self._log_listener.stop()
+
+    def shutdown_executor(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
 
     def check_tool_available(self, tool: str) -> bool:
         """Check if a tool is available, including custom dirsearch location"""
@@ -204,7 +351,8 @@ class ReconAuto:
                 logger.error('No auto-install rule for %s', m)
                 print(Fore.RED + f'[ERROR] No auto-install rule for {m}. Install manually.')
                 return False
-        # Re-check
+        # Re-check (installs may have added binaries the cache said were missing)
+        which.cache_clear()
         still = [t for t in REQUIRED if not self.check_tool_available(t)]
         if still:
             print(Fore.RED + '[ERROR] Some tools still missing after install: ' + ', '.join(still))
@@ -213,55 +361,92 @@ class ReconAuto:
         print(Fore.GREEN + '[OK] All tools installed and available')
         return True
 
+    def normalize_host(self, host: str) -> Optional[str]:
+        """Canonical form of a discovered hostname, or None if it is outside the target"""
+        host = host.strip().lower().rstrip('.').lstrip('*.')
+        if host == self.target or host.endswith('.' + self.target):
+            return host
+        return None
+
+    def run_subfinder(self, out: Path):
+        cp = run(['subfinder', '-d', self.target, '-silent'])
+        if cp.returncode != 0:
+            logger.warning('subfinder failed: %s', cp.stderr)
+        with open(out, 'w') as fh:
+            for line in cp.stdout.splitlines():
+                host = self.normalize_host(line)
+                if host:
+                    fh.write(host + '\n')
+
+    # Passive sources: results are written to the output file as they are parsed
+    def fetch_crtsh(self, out: Path):
+        try:
+            # deduplicate=Y drops the precertificate twin of every logged cert, roughly halving the body
+            with http_get(f'https://crt.sh/?q=%25.{self.target}&output=json&deduplicate=Y') as resp, open(out, 'w') as fh:
+                for item in iter_json_array(resp):
+                    # name_value may hold several SAN entries separated by newlines
+                    for name in (item.get('name_value') or '').split('\n'):
+                        host = self.normalize_host(name)
+                        if host:
+                            fh.write(host + '\n')
+        except OSError as e:
+            # URLError/HTTPError and socket timeouts: the source is just unavailable
+            logger.warning('crt.sh fetch failed: %s', e)
+        except Exception:
+            logger.exception('crt.sh parse')
+
+    def fetch_urlscan(self, out: Path):
+        try:
+            with http_get(f'https://urlscan.io/api/v1/search/?q=domain:{self.target}&size=10000') as resp, open(out, 'w') as fh:
+                # capped at 10000 results, small enough to decode in one go
+                for r in json_loads(resp.read()).get('results', []):
+                    host = self.normalize_host(r.get('page', {}).get('domain') or '')
+                    if host:
+                        fh.write(host + '\n')
+        except OSError as e:
+            logger.warning('urlscan fetch failed: %s', e)
+        except Exception:
+            logger.exception('urlscan parse')
+
     # Step 1: subfinder + passive sources
     def step_subenum(self):
         print(Fore.CYAN + '\n[STEP 1] Subdomain Enumeration...')
         subfinder_out = self.outdir / 'subfinder.txt'
-        run(['subfinder', '-d', self.target, '-silent', '-o', str(subfinder_out)])
-        # crt.sh
         crt_out = self.outdir / 'crtsh.txt'
-        cp = run(['curl', '-s', f'https://crt.sh/?q=%25.{self.target}&output=json'])
-        if cp.returncode == 0 and cp.stdout:
-            try:
-                import json
-                arr = json.loads(cp.stdout)
-                with open(crt_out, 'w') as fh:
-                    for item in arr:
-                        nv = item.get('name_value')
-                        if nv:
-                            fh.write(nv.replace('*.', '') + '\n')
-            except Exception as e:
-                logger.exception('crt.sh parse')
-        # urlscan
         urlscan_out = self.outdir / 'urlscan.txt'
-        cp = run(['curl', '-s', f'https://urlscan.io/api/v1/search/?q=domain:{self.target}&size=10000'])
-        if cp.returncode == 0 and cp.stdout:
-            try:
-                import json
-                data = json.loads(cp.stdout)
-                with open(urlscan_out, 'w') as fh:
-                    for r in data.get('results', []):
-                        domain = r.get('page', {}).get('domain')
-                        if domain:
-                            fh.write(domain + '\n')
-            except Exception:
-                logger.exception('urlscan parse')
 
-        # merge
-        all_files = [subfinder_out, crt_out, urlscan_out]
-        merged = set()
-        for f in all_files:
-            if f.exists():
+        # subfinder and the passive sources run concurrently; all three just wait on I/O
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            futs = [ex.submit(self.run_subfinder, subfinder_out),
+                    ex.submit(self.fetch_crtsh, crt_out),
+                    ex.submit(self.fetch_urlscan, urlscan_out)]
+            for f in as_completed(futs):
+                f.result()
+
+        # every source writes normalized hosts, so wildcard/case/trailing-dot variants collapse here
+        # merge: GNU sort streams and spills to disk, so huge crt.sh dumps never sit in memory
+        all_files = [f for f in (subfinder_out, crt_out, urlscan_out) if f.exists()]
+        subs_all = self.outdir / 'subs_all.txt'
+        sorted_ok = False
+        if os.name != 'nt' and all_files:
+            # C locale: plain byte order (same as sorted() below) and no collation overhead
+            cp = run(['sort', '-u', '--parallel=4', '-o', str(subs_all), *[str(f) for f in all_files]],
+                     env={**os.environ, 'LC_ALL': 'C'})
+            sorted_ok = cp.returncode == 0
+            if not sorted_ok:
+                logger.warning('sort -u failed, merging in Python: %s', cp.stderr)
+        if not sorted_ok:
+            merged = set()
+            for f in all_files:
                 with open(f, 'r') as fh:
                     for line in fh:
                         line = line.strip()
                         if line:
                             merged.add(line)
-        subs_all = self.outdir / 'subs_all.txt'
-        with open(subs_all, 'w') as fh:
-            for s in sorted(merged):
-                fh.write(s + '\n')
-        print(Fore.GREEN + f'[OK] Subdomain enumeration done ({len(merged)} hosts)')
+            with open(subs_all, 'w') as fh:
+                for s in sorted(merged):
+                    fh.write(s + '\n')
+        print(Fore.GREEN + f'[OK] Subdomain enumeration done ({_count_lines(subs_all)} hosts)')
 
     # Step 2: httpx
     def step_alive(self):
@@ -270,46 +455,111 @@ class ReconAuto:
         if not subs_all.exists():
             print(Fore.YELLOW + '[WARN] No subdomains file, skipping httpx')
             return
-        out_raw = self.outdir / 'httpx_raw.txt'
-        run(['httpx', '-l', str(subs_all), '-silent', '-threads', str(THREADS), '-status-code', '-title', '-ip', '-o', str(out_raw)])
+        out_raw = self.outdir / 'httpx.json'
         alive = self.outdir / 'alive.txt'
         ip_list = self.outdir / 'ip_list.txt'
-        if out_raw.exists():
-            with open(out_raw, 'r') as fr, open(alive, 'w') as fa, open(ip_list, 'w') as fi:
-                for line in fr:
-                    parts = line.strip().split()
-                    if not parts:
+        # httpx output is parsed as it is produced; unique IPs are fed straight into naabu
+        # so port scanning overlaps with probing (step_ports collects the result)
+        httpx = popen(['httpx', '-l', str(subs_all), '-silent', '-threads', str(THREADS), '-status-code', '-title', '-ip', '-json'],
+                      stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1)
+        if httpx is None:
+            return
+        self._naabu = popen(['naabu', '-silent', '-o', str(self.outdir / 'open_ports_raw.txt')],
+                            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, text=True, bufsize=1)
+        killer = threading.Timer(TIMEOUT, httpx.kill)
+        killer.start()
+        seen_ips = set()
+        try:
+            with open(out_raw, 'w') as fr, open(alive, 'w') as fa, open(ip_list, 'w') as fi:
+                for line in httpx.stdout:
+                    fr.write(line)
+                    try:
+                        rec = json_loads(line)
+                    except ValueError:
+                        continue
+                    url = rec.get('url')
+                    if not url:
                         continue
-                    url = parts[0]
                     fa.write(url + '\n')
-                    if '[' in line and ']' in line:
-                        import re
-                        m = re.search(r'\[([0-9.]+)\]', line)
-                        if m:
-                            fi.write(m.group(1) + '\n')
+                    ip = rec.get('host')
+                    if ip and ip not in seen_ips:
+                        seen_ips.add(ip)
+                        fi.write(ip + '\n')
+                        self._feed_naabu(ip)
+        finally:
+            killer.cancel()
+            httpx.stdout.close()
+            wait_proc(httpx)
+            if self._naabu is not None:
+                try:
+                    self._naabu.stdin.close()
+                except OSError:
+                    pass
         print(Fore.GREEN + f'[OK] httpx done, alive saved to {alive}')
 
+    def _feed_naabu(self, ip: str):
+        if self._naabu is None:
+            return
+        try:
+            self._naabu.stdin.write(ip + '\n')
+        except OSError:
+            logger.warning('naabu exited early; falling back to ip_list.txt')
+            wait_proc(self._naabu)
+            self._naabu = None
+
     # Step 3: naabu + nmap
     def step_ports(self):
         print(Fore.CYAN + '\n[STEP 3] Port scanning (naabu + nmap)')
         ip_list = self.outdir / 'ip_list.txt'
         if not ip_list.exists() or ip_list.stat().st_size == 0:
+            if self._naabu is not None:
+                # started by step_alive but never fed; its stdin is closed, so it exits at once
+                wait_proc(self._naabu)
+                self._naabu = None
             print(Fore.YELLOW + '[WARN] No IPs for naabu, skipping')
             return
         open_raw = self.outdir / 'open_ports_raw.txt'
-        run(['naabu', '-list', str(ip_list), '-o', str(open_raw), '-silent'])
+        if self._naabu is not None:
+            # already started and fed by step_alive
+            if wait_proc(self._naabu) != 0:
+                logger.warning('naabu exited with %s', self._naabu.returncode)
+            self._naabu = None
+        else:
+            run(['naabu', '-list', str(ip_list), '-o', str(open_raw), '-silent'])
         if open_raw.exists():
-            shutil.copyfile(open_raw, self.outdir / 'open_ports.txt')
-        # quick nmap
+            # nothing else reads the raw file, so a rename replaces the copy
+            os.replace(open_raw, self.outdir / 'open_ports.txt')
+        # quick nmap: hosts sharing the same open-port set go into one -iL run, so only the
+        # host:port pairs naabu actually found are probed
         try:
+            host_ports = defaultdict(set)
             with open(self.outdir / 'open_ports.txt', 'r') as fh:
                 for i, line in enumerate(fh):
                     if i >= 30:
                         break
-                    if ':' in line:
-                        host, port = line.strip().split(':', 1)
-                        nmap_out = self.outdir / f'nmap_{host}_{port}.txt'
-                        run(['nmap', '-sV', '-p', port, host, '-oN', str(nmap_out)])
+                    if ':' not in line:
+                        continue
+                    # rsplit: IPv6 hosts contain colons themselves
+                    host, port = line.strip().rsplit(':', 1)
+                    if host and port.isdigit():
+                        host_ports[host].add(int(port))
+            groups = defaultdict(list)
+            for host, ports in host_ports.items():
+                groups[(tuple(sorted(ports)), ':' in host)].append(host)
+            futs = {}
+            for n, ((ports, ipv6), hosts) in enumerate(sorted(groups.items())):
+                nmap_hosts = self.outdir / f'nmap_hosts_{n}.txt'
+                with open(nmap_hosts, 'w') as fh:
+                    fh.writelines(h + '\n' for h in sorted(hosts))
+                cmd = ['nmap', '-sV', '-p', ','.join(map(str, ports)), '-iL', str(nmap_hosts), '-oA', str(self.outdir / f'nmap_group_{n}'),
+                       '--min-hostgroup', '20', '--min-parallelism', '50']
+                if ipv6:
+                    cmd.append('-6')
+                futs[self.executor().submit(run, cmd)] = nmap_hosts.name
+            for fut in as_completed(futs):
+                cp = fut.result()
+                if cp.returncode != 0:
+                    logger.warning('nmap failed for %s: %s', futs[fut], cp.stderr)
         except Exception:
             logger.exception('nmap quick scan error')
         print(Fore.GREEN + '[OK] Port scan done')
@@ -340,33 +590,32 @@ class ReconAuto:
                 print(Fore.YELLOW + '[WARN] dirsearch not available, skipping directory search')
                 
         with open(alive, 'r') as fh:
-            for line in fh:
-                url = line.strip()
-                if not url:
-                    continue
-                name = url.replace('://', '_').replace('/', '_').replace(':', '_')
-                
-                # Run dirsearch if available
-                if dirsearch_cmd:
-                    cmd = dirsearch_cmd + ['-u', url, '-x', '403,404,500,400,502,503,429', '--random-agent', '-e', 'php,js,html', '-o', str(dir_out / f'{name}.txt')]
-                    cp = run(cmd)
-                    if cp.returncode != 0:
-                        logger.warning('dirsearch failed for %s: %s', url, cp.stderr)
-                
-                # Run katana if available
-                if which('katana'):
-                    cp = run(['katana', '-u', url, '-o', str(kat_out / f'{name}.txt')])
-                    if cp.returncode != 0:
-                        logger.warning('katana failed for %s: %s', url, cp.stderr)
-                        
+            urls = [l.strip() for l in fh if l.strip()]
+
+        # Submit every host for both tools up front and collect as they finish
+        pool = self.executor()
+        futs = {}
+        if dirsearch_cmd:
+            for url in urls:
+                futs[pool.submit(_run_dirsearch, url, dir_out, dirsearch_cmd)] = ('dirsearch', url)
+        if which('katana'):
+            for url in urls:
+                futs[pool.submit(_run_katana, url, kat_out)] = ('katana', url)
+        for fut in as_completed(futs):
+            tool, url = futs[fut]
+            try:
+                cp = fut.result()
+                if cp.returncode != 0:
+                    logger.warning('%s failed for %s: %s', tool, url, cp.stderr)
+            except Exception:
+                logger.exception('%s error for %s', tool, url)
+
         # merge dirsearch results
         merged_paths = self.outdir / 'dirs.txt'
-        with open(merged_paths, 'w') as outf:
+        with open(merged_paths, 'wb') as outf:
             for f in dir_out.glob('*.txt'):
                 try:
-                    with open(f, 'r') as rf:
-                        for l in rf:
-                            outf.write(l)
+                    append_file(outf, f)
                 except Exception:
                     pass
         print(Fore.GREEN + f'[OK] Content discovery done, paths in {merged_paths}')
@@ -379,11 +628,30 @@ class ReconAuto:
             print(Fore.YELLOW + '[WARN] No alive hosts, skipping nuclei')
             return
         if which('nuclei'):
-            cp = run(['nuclei', '-l', str(alive), '-rl', '10', '-bs', '2', '-c', '2', '-as', '-severity', 'critical,high,medium', '-o', str(self.outdir / 'nuclei_results.txt')])
-            if cp.returncode == 0:
+            # shard the host list so several rate-limited nuclei processes run side by side
+            with open(alive, 'r') as fh:
+                urls = [l.strip() for l in fh if l.strip()]
+            n = max(1, min(os.cpu_count() or 1, len(urls) // 50))
+            shard_dir = self.outdir / 'nuclei_shards'
+            shard_dir.mkdir(exist_ok=True)
+            shards, outs = [], []
+            for i in range(n):
+                shard = shard_dir / f'chunk_{i}.txt'
+                with open(shard, 'w') as fh:
+                    fh.writelines(u + '\n' for u in urls[i::n])
+                shards.append(shard)
+                outs.append(shard_dir / f'nuclei_{i}.txt')
+            failed = False
+            for shard, cp in zip(shards, self.executor().map(_run_nuclei, shards, outs)):
+                if cp.returncode != 0:
+                    failed = True
+                    logger.warning('nuclei failed for %s: %s', shard.name, cp.stderr)
+            with open(self.outdir / 'nuclei_results.txt', 'wb') as outf:
+                for out in outs:
+                    if out.exists():
+                        append_file(outf, out)
+            if not failed:
                 print(Fore.GREEN + '[OK] nuclei done')
-            else:
-                logger.warning('nuclei failed: %s', cp.stderr)
         else:
             print(Fore.YELLOW + '[WARN] nuclei not installed, skipping')
 
@@ -394,15 +662,24 @@ class ReconAuto:
         ports_count = 0
         try:
             if (self.outdir / 'subs_all.txt').exists():
-                subs_count = sum(1 for _ in open(self.outdir / 'subs_all.txt'))
+                subs_count = _count_lines(self.outdir / 'subs_all.txt')
             if (self.outdir / 'alive.txt').exists():
-                alive_count = sum(1 for _ in open(self.outdir / 'alive.txt'))
+                alive_count = _count_lines(self.outdir / 'alive.txt')
             if (self.outdir / 'open_ports.txt').exists():
-                ports_count = sum(1 for _ in open(self.outdir / 'open_ports.txt'))
-            import json
-            summary = {'target': self.target, 'scanned_at': now_ts(), 'stats': {'subdomains': subs_count, 'alive': alive_count, 'open_ports': ports_count}}
+                ports_count = _count_lines(self.outdir / 'open_ports.txt')
+            # fixed shape, so format it directly; json.dumps only escapes the target string
             with open(self.outdir / 'summary.json', 'w') as fh:
-                json.dump(summary, fh, indent=2)
+                fh.write(
+                    '{\n'
+                    f'  "target": {json.dumps(self.target)},\n'
+                    f'  "scanned_at": "{now_ts()}",\n'
+                    '  "stats": {\n'
+                    f'    "subdomains": {subs_count},\n'
+                    f'    "alive": {alive_count},\n'
+                    f'    "open_ports": {ports_count}\n'
+                    '  }\n'
+                    '}\n'
+                )
             print(Fore.GREEN + '[OK] summary.json created')
         except Exception:
             logger.exception('summary error')
@@ -410,21 +687,27 @@ class ReconAuto:
     def run(self):
         print(Fore.MAGENTA + DOMINICX_BANNER)
         print(Fore.YELLOW + f'[INFO] Target: {self.target}  Outdir: {self.outdir}')
-        ok = self.check_and_install_all()
-        if not ok:
-            print(Fore.RED + '[ERROR] Pre-checks failed. See logs for details.')
-            return
         try:
+            ok = self.check_and_install_all()
+            if not ok:
+                print(Fore.RED + '[ERROR] Pre-checks failed. See logs for details.')
+                return
             self.step_subenum()
             self.step_alive()
-            self.step_ports()
-            self.step_content()
+            # ports reads ip_list.txt and content reads alive.txt; both only wait on subprocesses
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                futs = [ex.submit(self.step_ports), ex.submit(self.step_content)]
+                for f in as_completed(futs):
+                    f.result()
             self.step_nuclei()
             self.generate_summary()
         except KeyboardInterrupt:
             print(Fore.RED + '\n[ABORT] Interrupted by user')
         except Exception:
             logger.exception('Unexpected error during run')
+        finally:
+            self.shutdown_executor()
+            self.close_log()
 
 # -------------------- Main --------------------
 